@@ -63,8 +63,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     LOGGER.info("Setting up sensor platform for Renogy BLE device %s", device_address)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Start the coordinator after all platforms are set up
-    # This ensures all entities have had a chance to subscribe to the coordinator
+    # Start the coordinator once the platforms are set up. Sensor entities are
+    # added later, from a background task, as data arrives; async_start also
+    # kicks off the initial refresh
     LOGGER.info("Starting coordinator for Renogy BLE device %s", device_address)
     try:
         start_func = coordinator.async_start()
@@ -72,10 +73,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as e:
         LOGGER.error("Error starting coordinator for %s: %s", device_address, e)
 
-    # Force an immediate refresh
-    LOGGER.info("Requesting initial refresh for Renogy BLE device %s", device_address)
-    hass.async_create_task(coordinator.async_request_refresh())
-
     return True
 
 
@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import re
-import traceback
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, Optional
 
@@ -82,7 +81,8 @@ def create_modbus_read_request(
     )
     crc_low, crc_high = modbus_crc(frame)
     frame.extend([crc_low, crc_high])
-    LOGGER.debug("create_request_payload: %s (%s)", register, list(frame))
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("create_request_payload: %s (%s)", register, list(frame))
     return frame
 
 
@@ -278,7 +278,7 @@ class RenogyBLEDevice:
 
         except Exception as e:
             LOGGER.error(
-                "Error parsing %s data from device %s: %s", cmd_name, self.name, str(e)
+                "Error parsing %s data from device %s: %s", cmd_name, self.name, e
             )
             # Log additional debug info to help diagnose the issue
             LOGGER.debug(
@@ -315,6 +315,8 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
             connectable=True,
         )
         self.device: Optional[RenogyBLEDevice] = None
+        # Data entities read from, resolved once per successful poll
+        self.effective_data: Dict[str, Any] = {}
         self.scan_interval = scan_interval
         self.device_type = device_type
         self.last_poll_time: Optional[datetime] = None
@@ -376,12 +378,11 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
                 update_callback()
         except Exception as err:
             self.last_update_success = False
-            error_traceback = traceback.format_exc()
             self.logger.debug(
-                "Error refreshing device %s: %s\n%s",
+                "Error refreshing device %s: %s",
                 self.address,
-                str(err),
-                error_traceback,
+                err,
+                exc_info=True,
             )
             if self.device:
                 self.device.update_availability(False, err)
@@ -605,11 +606,12 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
                             modbus_request = create_modbus_read_request(
                                 DEFAULT_DEVICE_ID, *cmd
                             )
-                            self.logger.debug(
-                                "Sending %s command: %s",
-                                cmd_name,
-                                list(modbus_request),
-                            )
+                            if self.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.debug(
+                                    "Sending %s command: %s",
+                                    cmd_name,
+                                    list(modbus_request),
+                                )
                             await client.write_gatt_char(
                                 RENOGY_WRITE_CHAR_UUID, modbus_request
                             )
@@ -658,14 +660,12 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
                             error = Exception("No commands completed successfully")
 
                     except BleakError as e:
-                        self.logger.info(
-                            "BLE error with device %s: %s", device.name, str(e)
-                        )
+                        self.logger.info("BLE error with device %s: %s", device.name, e)
                         error = e
                         success = False
                     except Exception as e:
                         self.logger.error(
-                            "Error reading data from device %s: %s", device.name, str(e)
+                            "Error reading data from device %s: %s", device.name, e
                         )
                         error = e
                         success = False
@@ -682,7 +682,7 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
                                 self.logger.debug(
                                     "Error disconnecting from device %s: %s",
                                     device.name,
-                                    str(e),
+                                    e,
                                 )
                                 # Don't override previous errors with disconnect errors
                                 if error is None:
@@ -692,7 +692,7 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
                     self.logger.info(
                         "Failed to establish connection with device %s: %s",
                         device.name,
-                        str(connection_error),
+                        connection_error,
                     )
                     error = connection_error
                     success = False
@@ -704,6 +704,7 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
                 # Update coordinator data if successful
                 if success and device.parsed_data:
                     self.data = dict(device.parsed_data)
+                    self.effective_data = device.parsed_data
                     self.logger.debug("Updated coordinator data: %s", self.data)
 
                 return success
@@ -734,7 +735,7 @@ class RenogyActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
                 try:
                     await self.device_data_callback(self.device)
                 except Exception as e:
-                    self.logger.error("Error in device data callback: %s", str(e))
+                    self.logger.error("Error in device data callback: %s", e)
 
             # Update all listeners after successful data acquisition
             self.async_update_listeners()
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Collection, Dict, List, Optional
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -66,13 +67,23 @@ KEY_DEVICE_ID = "device_id"
 KEY_MODEL = "model"
 KEY_MAX_DISCHARGING_POWER_TODAY = "max_discharging_power_today"
 
+# Marker for "no state published yet"
+_SENTINEL = object()
 
-@dataclass
+
+@dataclass(frozen=True, kw_only=True)
 class RenogyBLESensorDescription(SensorEntityDescription):
     """Describes a Renogy BLE sensor."""
 
-    # Function to extract value from the device's parsed data
+    # Function to compute the value from the device's parsed data; sensors
+    # without one read their key directly
     value_fn: Optional[Callable[[Dict[str, Any]], Any]] = None
+    # Identity values that never change once read from the device
+    static: bool = False
+    # Numeric readings are coerced to float and range-checked
+    numeric: bool = False
+    min_val: float = -1000
+    max_val: float = 10000
 
 
 BATTERY_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
@@ -82,7 +93,7 @@ BATTERY_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_BATTERY_VOLTAGE),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_BATTERY_CURRENT,
@@ -90,7 +101,7 @@ BATTERY_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_BATTERY_CURRENT),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_BATTERY_PERCENTAGE,
@@ -98,7 +109,6 @@ BATTERY_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_BATTERY_PERCENTAGE),
     ),
     RenogyBLESensorDescription(
         key=KEY_BATTERY_TEMPERATURE,
@@ -106,13 +116,12 @@ BATTERY_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_BATTERY_TEMPERATURE),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_BATTERY_TYPE,
         name="Battery Type",
         device_class=None,
-        value_fn=lambda data: data.get(KEY_BATTERY_TYPE),
     ),
     RenogyBLESensorDescription(
         key=KEY_CHARGING_AMP_HOURS_TODAY,
@@ -120,7 +129,6 @@ BATTERY_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement="Ah",
         device_class=None,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: data.get(KEY_CHARGING_AMP_HOURS_TODAY),
     ),
     RenogyBLESensorDescription(
         key=KEY_DISCHARGING_AMP_HOURS_TODAY,
@@ -128,13 +136,11 @@ BATTERY_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement="Ah",
         device_class=None,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: data.get(KEY_DISCHARGING_AMP_HOURS_TODAY),
     ),
     RenogyBLESensorDescription(
         key=KEY_CHARGING_STATUS,
         name="Charging Status",
         device_class=None,
-        value_fn=lambda data: data.get(KEY_CHARGING_STATUS),
     ),
 )
 
@@ -145,7 +151,7 @@ PV_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_PV_VOLTAGE),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_PV_CURRENT,
@@ -153,7 +159,7 @@ PV_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_PV_CURRENT),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_PV_POWER,
@@ -161,7 +167,7 @@ PV_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_PV_POWER),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_MAX_CHARGING_POWER_TODAY,
@@ -169,7 +175,7 @@ PV_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_MAX_CHARGING_POWER_TODAY),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_POWER_GENERATION_TODAY,
@@ -177,7 +183,6 @@ PV_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: data.get(KEY_POWER_GENERATION_TODAY),
     ),
     RenogyBLESensorDescription(
         key=KEY_POWER_GENERATION_TOTAL,
@@ -196,7 +201,7 @@ LOAD_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_LOAD_VOLTAGE),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_LOAD_CURRENT,
@@ -204,7 +209,7 @@ LOAD_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_LOAD_CURRENT),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_LOAD_POWER,
@@ -212,13 +217,12 @@ LOAD_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_LOAD_POWER),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_LOAD_STATUS,
         name="Load Status",
         device_class=None,
-        value_fn=lambda data: data.get(KEY_LOAD_STATUS),
     ),
     RenogyBLESensorDescription(
         key=KEY_POWER_CONSUMPTION_TODAY,
@@ -226,7 +230,6 @@ LOAD_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: data.get(KEY_POWER_CONSUMPTION_TODAY),
     ),
 )
 
@@ -237,21 +240,21 @@ CONTROLLER_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_CONTROLLER_TEMPERATURE),
+        numeric=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_DEVICE_ID,
         name="Device ID",
         device_class=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get(KEY_DEVICE_ID),
+        static=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_MODEL,
         name="Model",
         device_class=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get(KEY_MODEL),
+        static=True,
     ),
     RenogyBLESensorDescription(
         key=KEY_MAX_DISCHARGING_POWER_TODAY,
@@ -259,12 +262,21 @@ CONTROLLER_SENSORS: tuple[RenogyBLESensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get(KEY_MAX_DISCHARGING_POWER_TODAY),
+        numeric=True,
     ),
 )
 
-# All sensors combined
-ALL_SENSORS = BATTERY_SENSORS + PV_SENSORS + LOAD_SENSORS + CONTROLLER_SENSORS
+# Every sensor paired with its category, in creation order
+_FLAT_SENSORS: tuple[tuple[str, RenogyBLESensorDescription], ...] = tuple(
+    (category, description)
+    for category, sensor_list in (
+        ("Battery", BATTERY_SENSORS),
+        ("PV", PV_SENSORS),
+        ("Load", LOAD_SENSORS),
+        ("Controller", CONTROLLER_SENSORS),
+    )
+    for description in sensor_list
+)
 
 
 async def async_setup_entry(
@@ -282,98 +294,148 @@ async def async_setup_entry(
     device_type = config_entry.data.get(CONF_DEVICE_TYPE, DEFAULT_DEVICE_TYPE)
     LOGGER.debug("Setting up sensors for device type: %s", device_type)
 
-    # Try to wait for a real device name before creating entities
-    # This helps ensure entity IDs will match the real device name
-    if (
-        not coordinator.device
-        or coordinator.device.name.startswith("Unknown")
-        or not coordinator.device.name.startswith(RENOGY_BT_PREFIX)
-    ):
-        LOGGER.debug("Waiting for real device name before creating entities...")
-        # Force an immediate refresh to try getting device info
-        await coordinator.async_request_refresh()
+    # Entities are added on demand once the device reports a value for them,
+    # so capabilities the device lacks never show up as "unknown"
+    added_keys: set[str] = set()
 
-        # Wait for a short time to see if we can get the real device name
-        # We'll wait up to 10 seconds, checking every second
-        real_name_found = False
-        for _ in range(10):
-            await asyncio.sleep(1)
-            if coordinator.device and coordinator.device.name.startswith(
-                RENOGY_BT_PREFIX
-            ):
-                LOGGER.debug("Real device name found: %s", coordinator.device.name)
-                real_name_found = True
-                break
-
-        if not real_name_found:
-            LOGGER.debug(
-                "No real device name found after waiting. Using generic name for entities."
-            )
+    @callback
+    def _async_add_new_entities() -> None:
+        """Create entities for sensor keys that have appeared in the data."""
+        data = coordinator.effective_data
+        if not data:
+            return
+
+        new_keys = {key for key in data if key not in added_keys}
+        if not new_keys:
+            return
 
-    # Now create entities with the best name we have
-    if coordinator.device and (
-        coordinator.device.name.startswith(RENOGY_BT_PREFIX)
-        or not coordinator.device.name.startswith("Unknown")
-    ):
-        LOGGER.info("Creating entities with device name: %s", coordinator.device.name)
-        device_entities = create_device_entities(
-            coordinator, coordinator.device, device_type
+        # Create entities with the best name we have
+        device = coordinator.device
+        if device and (
+            device.name.startswith(RENOGY_BT_PREFIX)
+            or not device.name.startswith("Unknown")
+        ):
+            LOGGER.info("Creating entities with device name: %s", device.name)
+        else:
+            LOGGER.info("Creating entities with coordinator only (generic name)")
+            device = None
+        new_entities = _create_entities(coordinator, device, device_type, new_keys)
+
+        # Remember every key we've seen, including ones without a sensor
+        added_keys.update(new_keys)
+        if new_entities:
+            LOGGER.debug("Adding %s entities", len(new_entities))
+            async_add_entities(new_entities)
+
+    async def _async_delayed_setup() -> None:
+        """Wait for the device name, then start adding entities."""
+        await _async_wait_for_device_name(coordinator)
+
+        config_entry.async_on_unload(
+            coordinator.async_add_listener(_async_add_new_entities)
         )
-    else:
-        LOGGER.info("Creating entities with coordinator only (generic name)")
-        device_entities = create_coordinator_entities(coordinator, device_type)
+        _async_add_new_entities()
 
-    # Add all entities to Home Assistant
-    if device_entities:
-        LOGGER.debug("Adding %s entities", len(device_entities))
-        async_add_entities(device_entities)
-    else:
-        LOGGER.warning("No entities were created")
+        if not added_keys:
+            LOGGER.debug("No device data yet, entities will be added once it arrives")
 
+    # The name wait can take several seconds, so don't hold up platform setup
+    config_entry.async_create_background_task(
+        hass,
+        _async_delayed_setup(),
+        name=f"renogy_setup_{config_entry.entry_id}",
+    )
 
-def create_entities_helper(
+
+async def _async_wait_for_device_name(
     coordinator: RenogyActiveBluetoothCoordinator,
-    device: Optional[RenogyBLEDevice],
-    device_type: str = DEFAULT_DEVICE_TYPE,
-) -> List[RenogyBLESensor]:
-    """Create sensor entities with provided coordinator and optional device."""
-    entities = []
-
-    # Group sensors by category
-    for category_name, sensor_list in {
-        "Battery": BATTERY_SENSORS,
-        "PV": PV_SENSORS,
-        "Load": LOAD_SENSORS,
-        "Controller": CONTROLLER_SENSORS,
-    }.items():
-        for description in sensor_list:
-            sensor = RenogyBLESensor(
-                coordinator, device, description, category_name, device_type
-            )
-            entities.append(sensor)
+) -> None:
+    """Wait for a real device name so entity IDs will match it."""
+    if coordinator.device and coordinator.device.name.startswith(RENOGY_BT_PREFIX):
+        return
 
-    return entities
+    LOGGER.debug("Waiting for real device name before creating entities...")
+    real_name_found = asyncio.Event()
+
+    @callback
+    def _async_check_device_name() -> None:
+        """Signal the wait below once the real device name is known."""
+        if coordinator.device and coordinator.device.name.startswith(RENOGY_BT_PREFIX):
+            real_name_found.set()
 
+    remove_listener = coordinator.async_add_listener(_async_check_device_name)
+    try:
+        # Force an immediate refresh to try getting device info
+        await coordinator.async_request_refresh()
+        _async_check_device_name()
+
+        # Wait up to 10 seconds for a coordinator update with the real name
+        await asyncio.wait_for(real_name_found.wait(), 10)
+        LOGGER.debug("Real device name found: %s", coordinator.device.name)
+    except asyncio.TimeoutError:
+        LOGGER.debug(
+            "No real device name found after waiting. Using generic name for entities."
+        )
+    finally:
+        remove_listener()
 
-def create_coordinator_entities(
+
+def _create_entities(
     coordinator: RenogyActiveBluetoothCoordinator,
+    device: Optional[RenogyBLEDevice] = None,
     device_type: str = DEFAULT_DEVICE_TYPE,
+    keys: Optional[Collection[str]] = None,
 ) -> List[RenogyBLESensor]:
-    """Create sensor entities with just the coordinator (no device yet)."""
-    entities = create_entities_helper(coordinator, None, device_type)
-    LOGGER.info("Created %s entities with coordinator only", len(entities))
+    """Create sensor entities with provided coordinator and optional device.
+
+    If keys is given, only sensors whose key is in it are created.
+    """
+    device_info = _build_device_info(coordinator, device, device_type)
+    entities = [
+        RenogyBLESensor(
+            coordinator,
+            device,
+            description,
+            category,
+            device_type,
+            device_info,
+        )
+        for category, description in _FLAT_SENSORS
+        if keys is None or description.key in keys
+    ]
+    if device:
+        LOGGER.info("Created %s entities for device %s", len(entities), device.name)
+    else:
+        LOGGER.info("Created %s entities with coordinator only", len(entities))
     return entities
 
 
-def create_device_entities(
+def _build_device_info(
     coordinator: RenogyActiveBluetoothCoordinator,
-    device: RenogyBLEDevice,
-    device_type: str = DEFAULT_DEVICE_TYPE,
-) -> List[RenogyBLESensor]:
-    """Create sensor entities for a device."""
-    entities = create_entities_helper(coordinator, device, device_type)
-    LOGGER.info("Created %s entities for device %s", len(entities), device.name)
-    return entities
+    device: Optional[RenogyBLEDevice],
+    device_type: str,
+) -> DeviceInfo:
+    """Build device registry info for the device, or the coordinator if none yet."""
+    # Generate a device model name that includes the device type
+    device_model = f"Renogy {device_type.capitalize()}"
+    if device and device.parsed_data and KEY_MODEL in device.parsed_data:
+        device_model = device.parsed_data[KEY_MODEL]
+
+    if device:
+        address = device.address
+        name = device.name
+    else:
+        address = coordinator.address
+        name = f"Renogy {device_type.capitalize()}"
+
+    return DeviceInfo(
+        identifiers={(DOMAIN, address)},
+        name=name,
+        manufacturer=ATTR_MANUFACTURER,
+        model=device_model,
+        hw_version=f"BLE Address: {address}",
+        sw_version=device_type.capitalize(),  # Add device type as software version for clarity
+    )
 
 
 class RenogyBLESensor(CoordinatorEntity, SensorEntity):
@@ -382,6 +444,25 @@ class RenogyBLESensor(CoordinatorEntity, SensorEntity):
     entity_description: RenogyBLESensorDescription
     coordinator: RenogyActiveBluetoothCoordinator
 
+    # Per-entity state read on every update; the HA base classes still carry
+    # a __dict__, but these attributes resolve through slot descriptors
+    __slots__ = (
+        "_device",
+        "_device_info_resolved",
+        "_category",
+        "_device_type",
+        "_last_updated",
+        "_key",
+        "_log_name",
+        "_value_fn",
+        "_static",
+        "_numeric",
+        "_min_val",
+        "_max_val",
+        "_last_value",
+        "_last_available",
+    )
+
     def __init__(
         self,
         coordinator: RenogyActiveBluetoothCoordinator,
@@ -389,65 +470,61 @@ class RenogyBLESensor(CoordinatorEntity, SensorEntity):
         description: RenogyBLESensorDescription,
         category: str = None,
         device_type: str = DEFAULT_DEVICE_TYPE,
+        device_info: Optional[DeviceInfo] = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._key = description.key
+        self._value_fn = description.value_fn
+        self._static = description.static
+        self._numeric = description.numeric
+        self._min_val = description.min_val
+        self._max_val = description.max_val
         self._device = device
+        self._device_info_resolved = device is not None
         self._category = category
         self._device_type = device_type
-        self._attr_native_value = None
-
-        # Generate a device model name that includes the device type
-        device_model = f"Renogy {device_type.capitalize()}"
-        if device and device.parsed_data and KEY_MODEL in device.parsed_data:
-            device_model = device.parsed_data[KEY_MODEL]
 
         # Device-dependent properties
         if device:
             self._attr_unique_id = f"{device.address}_{description.key}"
             self._attr_name = f"{device.name} {description.name}"
-
-            # Properly set up device_info for the device registry
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, device.address)},
-                name=device.name,
-                manufacturer=ATTR_MANUFACTURER,
-                model=device_model,
-                hw_version=f"BLE Address: {device.address}",
-                sw_version=device_type.capitalize(),  # Add device type as software version for clarity
-            )
         else:
             # If we don't have a device yet, use coordinator address for unique ID
             self._attr_unique_id = f"{coordinator.address}_{description.key}"
             self._attr_name = f"Renogy {description.name}"
+        self._log_name = self._attr_name
 
-            # Set up basic device info based on coordinator
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, coordinator.address)},
-                name=f"Renogy {device_type.capitalize()}",
-                manufacturer=ATTR_MANUFACTURER,
-                model=device_model,
-                hw_version=f"BLE Address: {coordinator.address}",
-                sw_version=device_type.capitalize(),  # Add device type as software version for clarity
-            )
+        # Entities created together share one DeviceInfo
+        if device_info is None:
+            device_info = _build_device_info(coordinator, device, device_type)
+        self._attr_device_info = device_info
+
+        self._last_updated: Optional[float] = None
+        # Last published state, used to skip unchanged writes
+        self._last_value: Any = _SENTINEL
+        self._last_available: Any = _SENTINEL
+        self._update_available()
 
-        self._last_updated = None
+        # Initial value, kept current by _handle_coordinator_update
+        data = self._current_data()
+        self._attr_native_value = self._compute_value(data) if data else None
 
     @property
     def device(self) -> Optional[RenogyBLEDevice]:
         """Get the current device - either stored or from coordinator."""
-        if self._device:
-            return self._device
+        if not self._device_info_resolved:
+            self._resolve_device()
+        return self._device
 
+    def _resolve_device(self) -> None:
+        """Adopt the coordinator's device and rename to match it, once."""
         # Try to get device from coordinator
-        if hasattr(self.coordinator, "device") and self.coordinator.device:
-            self._device = self.coordinator.device
-
-            # Generate a device model name that includes the device type
-            device_model = f"Renogy {self._device_type.capitalize()}"
-            if self._device.parsed_data and KEY_MODEL in self._device.parsed_data:
-                device_model = self._device.parsed_data[KEY_MODEL]
+        coordinator_device = self.coordinator.device
+        if coordinator_device is not None:
+            self._device = coordinator_device
+            self._device_info_resolved = True
 
             # Update our unique_id to match the actual device
             self._attr_unique_id = (
@@ -455,120 +532,92 @@ class RenogyBLESensor(CoordinatorEntity, SensorEntity):
             )
             # Also update our name
             self._attr_name = f"{self._device.name} {self.entity_description.name}"
+            self._log_name = self._attr_name
 
             # And device_info
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, self._device.address)},
-                name=self._device.name,
-                manufacturer=ATTR_MANUFACTURER,
-                model=device_model,
-                hw_version=f"BLE Address: {self._device.address}",
-                sw_version=self._device_type.capitalize(),  # Add device type as software version
+            self._attr_device_info = _build_device_info(
+                self.coordinator, self._device, self._device_type
             )
             LOGGER.debug("Updated device info with real name: %s", self._device.name)
 
-        return self._device
-
     @property
     def available(self) -> bool:
         """Return if the sensor is available."""
-        # Basic coordinator availability check
-        if not self.coordinator.last_update_success:
-            return False
-
-        # Check device availability if we have a device
-        if self._device and not self._device.is_available:
-            return False
-
-        # For the actual data, check either the device's parsed_data or coordinator's data
-        data_available = False
-        if self._device and self._device.parsed_data:
-            data_available = True
-        elif self.coordinator.data:
-            data_available = True
-
-        return data_available
-
-    @property
-    def native_value(self) -> Any:
-        """Return the sensor's value."""
-        # Use cached value if available
-        if self._attr_native_value is not None:
-            return self._attr_native_value
-
-        device = self.device
-        data = None
-
-        # Get data from device if available, otherwise from coordinator
-        if device and device.parsed_data:
-            data = device.parsed_data
-        elif self.coordinator.data:
-            data = self.coordinator.data
+        return self._attr_available
+
+    def _update_available(self) -> None:
+        """Recompute availability, called whenever the coordinator updates."""
+        data_present = bool(self.coordinator.effective_data)
+        self._attr_available = (
+            # Basic coordinator availability check
+            self.coordinator.last_update_success
+            # Check device availability if we have a device
+            and (self._device is None or self._device.is_available)
+            and data_present
+        )
 
-        if not data:
-            return None
+    def _current_data(self) -> Optional[Dict[str, Any]]:
+        """Return the data to read values from, if any."""
+        # Resolved by the coordinator once per poll for all entities
+        return self.coordinator.effective_data or None
 
+    def _compute_value(self, data: Dict[str, Any]) -> Any:
+        """Extract and validate this sensor's value from the data."""
         try:
-            if self.entity_description.value_fn:
-                value = self.entity_description.value_fn(data)
-                # Basic type validation based on device_class
-                if value is not None:
-                    if self.device_class in [
-                        SensorDeviceClass.VOLTAGE,
-                        SensorDeviceClass.CURRENT,
-                        SensorDeviceClass.TEMPERATURE,
-                        SensorDeviceClass.POWER,
-                    ]:
-                        try:
-                            value = float(value)
-                            # Basic range validation
-                            if value < -1000 or value > 10000:
-                                LOGGER.warning(
-                                    "Value %s out of reasonable range for %s",
-                                    value,
-                                    self.name,
-                                )
-                                return None
-                        except (ValueError, TypeError):
-                            LOGGER.warning(
-                                "Invalid numeric value for %s: %s",
-                                self.name,
-                                value,
-                            )
-                            return None
-
-                # Cache the value
-                self._attr_native_value = value
-                return value
+            if self._value_fn:
+                value = self._value_fn(data)
+            else:
+                value = data.get(self._key)
+            # Basic type validation for numeric sensors
+            if value is not None and self._numeric:
+                try:
+                    value = float(value)
+                    # Basic range validation
+                    if value < self._min_val or value > self._max_val:
+                        LOGGER.warning(
+                            "Value %s out of reasonable range for %s",
+                            value,
+                            self._log_name,
+                        )
+                        return None
+                except (ValueError, TypeError):
+                    LOGGER.warning(
+                        "Invalid numeric value for %s: %s",
+                        self._log_name,
+                        value,
+                    )
+                    return None
+            return value
         except Exception as e:
-            LOGGER.warning("Error getting native value for %s: %s", self.name, e)
+            LOGGER.warning("Error getting native value for %s: %s", self._log_name, e)
         return None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        LOGGER.debug("Coordinator update for %s", self.name)
-
-        # Clear cached value to force a refresh on next state read
-        self._attr_native_value = None
+        LOGGER.debug("Coordinator update for %s", self._log_name)
 
         # If we don't have a device yet, check if coordinator now has one
-        if (
-            not self._device
-            and hasattr(self.coordinator, "device")
-            and self.coordinator.device
-        ):
-            self._device = self.coordinator.device
-            # Update our unique_id and name to match the actual device
-            self._attr_unique_id = (
-                f"{self._device.address}_{self.entity_description.key}"
-            )
-            self._attr_name = f"{self._device.name} {self.entity_description.name}"
-
-        self._last_updated = datetime.now()
-
-        # Explicitly get our value before updating state, so it's cached
-        self.native_value
+        if not self._device_info_resolved:
+            self._resolve_device()
+
+        # Refresh the value, unless this is a static identity value we have
+        # already read
+        if not (self._static and self._attr_native_value is not None):
+            data = self._current_data()
+            self._attr_native_value = self._compute_value(data) if data else None
+        value = self._attr_native_value
+        self._update_available()
+        available = self._attr_available
+
+        # Most readings are static between polls; only publish on change
+        if value == self._last_value and available == self._last_available:
+            return
+        self._last_value = value
+        self._last_available = available
+
+        # Plain timestamp; only formatted when the attributes are rebuilt
+        self._last_updated = time.time()
 
         # Update entity state
         self.async_write_ha_state()
@@ -578,17 +627,13 @@ class RenogyBLESensor(CoordinatorEntity, SensorEntity):
         """Return additional state attributes."""
         attrs = {}
         if self._last_updated:
-            attrs["last_updated"] = self._last_updated.isoformat()
+            attrs["last_updated"] = datetime.fromtimestamp(
+                self._last_updated
+            ).isoformat()
 
         # Add the device's RSSI as attribute if available
         device = self.device
         if device and hasattr(device, "rssi") and device.rssi is not None:
             attrs["rssi"] = device.rssi
 
-        # Add data source info
-        if self._device and self._device.parsed_data:
-            attrs["data_source"] = "device"
-        elif self.coordinator.data:
-            attrs["data_source"] = "coordinator"
-
         return attrs
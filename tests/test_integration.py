@@ -1,5 +1,6 @@
 """Integration tests for the Renogy BLE integration without dependencies."""
 
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,26 +10,13 @@ DOMAIN = "renogy"
 CONF_SCAN_INTERVAL = "scan_interval"
 
 
-@pytest.fixture
-def mock_ble_device():
-    """Create a mock BLE device."""
-    device = MagicMock()
-    device.address = "AA:BB:CC:DD:EE:FF"
-    device.name = "BT-TH-12345"
-    device.rssi = -60
-    return device
+def _noop():
+    """Stand in for the unsubscribe callback returned by async_start."""
 
 
-@pytest.fixture
-def mock_renogy_device():
-    """Create a mock Renogy BLE device with parsed data."""
-    device = MagicMock()
-    device.address = "AA:BB:CC:DD:EE:FF"
-    device.name = "BT-TH-12345"
-    device.rssi = -60
-    device.available = True
-    device.is_available = True
-    device.parsed_data = {
+# Parsed data reported by the mock Renogy device
+PARSED_DATA = MappingProxyType(
+    {
         "battery_voltage": 12.8,
         "battery_current": 1.5,
         "battery_percentage": 85,
@@ -54,32 +42,43 @@ def mock_renogy_device():
         "firmware_version": "v1.2.3",
         "max_discharging_power_today": 30.0,
     }
-    device.update_availability = MagicMock()
-    device.update_parsed_data = MagicMock(return_value=True)
-    return device
+)
+
+
+@pytest.fixture(scope="session")
+def mock_ble_device():
+    """Create a mock BLE device."""
+    return SimpleNamespace(
+        address="AA:BB:CC:DD:EE:FF",
+        name="BT-TH-12345",
+        rssi=-60,
+    )
 
 
 @pytest.fixture
-def mock_coordinator():
-    """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.data = {}
-    coordinator.device = None
-    coordinator.address = "AA:BB:CC:DD:EE:FF"
-    coordinator.last_update_success = True
-    coordinator.async_request_refresh = MagicMock()
-    coordinator.async_start = MagicMock(return_value=lambda: None)
-    # Add a _listeners array that coordinator implementations typically have
-    coordinator._listeners = []
-    return coordinator
+def mock_renogy_device():
+    """Create a mock Renogy BLE device with parsed data."""
+    return SimpleNamespace(
+        address="AA:BB:CC:DD:EE:FF",
+        name="BT-TH-12345",
+        rssi=-60,
+        available=True,
+        is_available=True,
+        parsed_data=dict(PARSED_DATA),
+    )
 
 
 @pytest.fixture
-def mock_hass():
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock()
-    hass.data = {}
-    return hass
+def mock_coordinator():
+    """Create a mock coordinator."""
+    return SimpleNamespace(
+        data={},
+        device=None,
+        address="AA:BB:CC:DD:EE:FF",
+        last_update_success=True,
+        async_request_refresh=MagicMock(),
+        async_start=MagicMock(return_value=_noop),
+    )
 
 
 def test_device_discovery_and_data(mock_coordinator, mock_renogy_device):
@@ -99,58 +98,25 @@ def test_device_discovery_and_data(mock_coordinator, mock_renogy_device):
     assert mock_coordinator.data["model"] == "Rover 40A"
 
 
-def test_coordinator_device_interaction(mock_coordinator, mock_renogy_device):
-    """Test coordinator behavior with device."""
-    # Set up coordinator with mock device
-    mock_coordinator.device = mock_renogy_device
-    mock_coordinator.data = mock_renogy_device.parsed_data
-
-    # Add a callback function that will update the device
-    def update_callback():
-        mock_renogy_device.update_availability(True, None)
-
-    # Register the callback with the coordinator
-    mock_coordinator._listeners.append(update_callback)
-
-    # Test device availability propagation
-    mock_renogy_device.is_available = False
-    assert not mock_renogy_device.is_available
-
-    # Test coordinator successful data refresh
-    mock_coordinator.last_update_success = True
-
-    # Simulate calling callback from BT update
-    for callback in mock_coordinator._listeners:
-        callback()
-
-    # Device update was used to update data
-    mock_renogy_device.update_availability.assert_called_with(True, None)
-
-
-def test_malformed_data_handling(mock_coordinator, mock_renogy_device):
-    """Test handling of malformed data from the device."""
-    # Set up coordinator with mock device
-    mock_coordinator.device = mock_renogy_device
-
-    # Save the original good data
-    good_data = dict(mock_renogy_device.parsed_data)
-
-    # Test cases for different malformed data scenarios
-    test_cases = [
+@pytest.mark.parametrize(
+    "test_data",
+    [
         {},  # Empty data
         {"battery_voltage": None},  # None value
         {"battery_voltage": "invalid"},  # Wrong type
         {"unknown_field": 123},  # Unknown field
-    ]
-
-    for test_data in test_cases:
-        # Update device with bad data
-        mock_renogy_device.parsed_data = test_data
-        mock_coordinator.data = test_data
+    ],
+    ids=["empty", "none_value", "wrong_type", "unknown_field"],
+)
+def test_malformed_data_handling(mock_coordinator, mock_renogy_device, test_data):
+    """Test handling of malformed data from the device."""
+    # Set up coordinator with mock device
+    mock_coordinator.device = mock_renogy_device
 
-        # Device should remain available despite bad data
-        assert mock_renogy_device.available is True
+    # Update device with bad data, in place like a real poll does
+    mock_renogy_device.parsed_data.clear()
+    mock_renogy_device.parsed_data.update(test_data)
+    mock_coordinator.data = dict(mock_renogy_device.parsed_data)
 
-    # Restore good data
-    mock_renogy_device.parsed_data = good_data
-    mock_coordinator.data = good_data
+    # Device should remain available despite bad data
+    assert mock_renogy_device.available is True
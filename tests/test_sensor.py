@@ -1,6 +1,6 @@
 """Tests for Renogy sensor functionality."""
 
-from unittest.mock import MagicMock
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
@@ -20,11 +20,31 @@ LOAD_POWER = "load_power"
 LOAD_STATUS = "load_status"
 CONTROLLER_TEMPERATURE = "controller_temperature"
 
+# Expected value of each sensor key constant
+EXPECTED_KEYS = (
+    # Battery related keys
+    ("battery_voltage", BATTERY_VOLTAGE),
+    ("battery_current", BATTERY_CURRENT),
+    ("battery_percentage", BATTERY_PERCENTAGE),
+    ("battery_temperature", BATTERY_TEMPERATURE),
+    ("battery_type", BATTERY_TYPE),
+    ("charging_status", CHARGING_STATUS),
+    # PV related keys
+    ("pv_voltage", PV_VOLTAGE),
+    ("pv_current", PV_CURRENT),
+    ("pv_power", PV_POWER),
+    # Load related keys
+    ("load_voltage", LOAD_VOLTAGE),
+    ("load_current", LOAD_CURRENT),
+    ("load_power", LOAD_POWER),
+    ("load_status", LOAD_STATUS),
+    # Controller related keys
+    ("controller_temperature", CONTROLLER_TEMPERATURE),
+)
 
-@pytest.fixture
-def mock_sensor_data():
-    """Create mock sensor data."""
-    return {
+# Parsed data reported by the mock device
+SENSOR_DATA = MappingProxyType(
+    {
         # Battery data
         BATTERY_VOLTAGE: 12.6,
         BATTERY_CURRENT: 1.5,
@@ -53,53 +73,41 @@ def mock_sensor_data():
         "model": "Rover",
         "max_discharging_power_today": 25,
     }
+)
+
+
+@pytest.fixture(scope="session")
+def mock_sensor_data():
+    """Provide the read-only mock sensor data."""
+    return SENSOR_DATA
 
 
 @pytest.fixture
 def mock_device():
     """Create a mock Renogy device."""
-    device = MagicMock()
-    device.name = "Test Renogy Device"
-    device.address = "AA:BB:CC:DD:EE:FF"
-    device.is_available = True
-    device.parsed_data = {}  # Will be filled from mock_sensor_data
-    return device
+    return SimpleNamespace(
+        name="Test Renogy Device",
+        address="AA:BB:CC:DD:EE:FF",
+        is_available=True,
+        parsed_data={},  # Will be filled from mock_sensor_data
+    )
 
 
 @pytest.fixture
 def mock_coordinator():
     """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.last_update_success = True
-    coordinator.data = {}  # Will be filled from mock_sensor_data
-    coordinator.device = None  # Will be set in tests
-    coordinator.address = "AA:BB:CC:DD:EE:FF"
-    return coordinator
+    return SimpleNamespace(
+        last_update_success=True,
+        data={},  # Will be filled from mock_sensor_data
+        device=None,  # Will be set in tests
+        address="AA:BB:CC:DD:EE:FF",
+    )
 
 
-def test_sensor_key_registration():
+@pytest.mark.parametrize(("expected", "actual"), EXPECTED_KEYS)
+def test_sensor_key_registration(expected, actual):
     """Test that all necessary sensor keys are registered correctly."""
-    # Battery related keys
-    assert BATTERY_VOLTAGE == "battery_voltage"
-    assert BATTERY_CURRENT == "battery_current"
-    assert BATTERY_PERCENTAGE == "battery_percentage"
-    assert BATTERY_TEMPERATURE == "battery_temperature"
-    assert BATTERY_TYPE == "battery_type"
-    assert CHARGING_STATUS == "charging_status"
-
-    # PV related keys
-    assert PV_VOLTAGE == "pv_voltage"
-    assert PV_CURRENT == "pv_current"
-    assert PV_POWER == "pv_power"
-
-    # Load related keys
-    assert LOAD_VOLTAGE == "load_voltage"
-    assert LOAD_CURRENT == "load_current"
-    assert LOAD_POWER == "load_power"
-    assert LOAD_STATUS == "load_status"
-
-    # Controller related keys
-    assert CONTROLLER_TEMPERATURE == "controller_temperature"
+    assert actual == expected
 
 
 def test_sensor_value_extraction(mock_device, mock_coordinator, mock_sensor_data):